@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+基准测试和验证脚本(bench_*.py)的公共设置
+导入 app 时会建表并执行迁移，脚本要在导入 app 之前先导入本模块：
+数据库指向临时目录，不改动 messages.db；脚本结束时调用 cleanup() 删除临时目录
+
+用法:
+    from bench_common import BENCH_DIR, cleanup  # 必须在 from app import ... 之前
+"""
+
+import os
+import shutil
+import tempfile
+
+BENCH_DIR = tempfile.mkdtemp(prefix='maycoffee_bench_')
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(BENCH_DIR, 'app.db')}"
+os.environ['AUTO_MIGRATE'] = '1'
+
+
+def cleanup():
+    """删除临时目录(包括其中的数据库)"""
+    shutil.rmtree(BENCH_DIR, ignore_errors=True)
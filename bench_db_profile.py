@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+数据库引擎配置压测：对比默认 SQLite 设置与生产配置(WAL 等 PRAGMA + 连接池)
+在读多写少的混合负载下的吞吐量和出错数
+
+读线程不断请求留言列表(不带 If-None-Match，每次都真正查询)，
+写线程不断发表留言，持续若干秒后统计每秒完成的读/写请求数
+
+用法: python bench_db_profile.py [读线程数] [写线程数] [每轮秒数]
+压测使用临时数据库，不会改动 messages.db
+"""
+
+import os
+import sys
+import threading
+import time
+
+from bench_common import BENCH_DIR, cleanup  # 先于 app 导入：数据库指向临时目录
+from app import app, db, Message, SQLITE_PRAGMAS, build_engine_options
+
+SEED_MESSAGES = 500
+
+
+def configure(profile, db_path):
+    uri = f'sqlite:///{db_path}'
+    app.config['SQLALCHEMY_DATABASE_URI'] = uri
+    app.config['NOTIFY_DISPATCHER_ENABLED'] = False
+    app.config['RATE_LIMIT_ENABLED'] = False  # 压测写入不受留言限流影响
+    if profile == 'production':
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = build_engine_options(uri)
+        app.config['SQLITE_PRAGMAS'] = dict(SQLITE_PRAGMAS)
+    else:
+        # 原来的默认设置：每次新建连接，回滚日志模式，不设置 PRAGMA
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {}
+        app.config['SQLITE_PRAGMAS'] = {}
+    with app.app_context():
+        db.create_all()
+        db.session.add_all([
+            Message(title=f'压测留言{i}', name='bench', email='bench@example.com',
+                    content='咖啡很好喝' * 20, approved=True)
+            for i in range(SEED_MESSAGES)
+        ])
+        db.session.commit()
+
+
+def run_load(readers, writers, seconds):
+    stop = time.perf_counter() + seconds
+    counts = {'read': 0, 'write': 0, 'read_error': 0, 'write_error': 0}
+    lock = threading.Lock()
+
+    def reader():
+        client = app.test_client()
+        while time.perf_counter() < stop:
+            ok = client.get('/api/messages').status_code == 200
+            with lock:
+                counts['read' if ok else 'read_error'] += 1
+
+    def writer(idx):
+        client = app.test_client()
+        n = 0
+        while time.perf_counter() < stop:
+            n += 1
+            response = client.post('/api/messages', data={
+                'title': f'写入{idx}-{n}', 'name': 'bench', 'email': 'bench@example.com', 'content': '新留言'
+            })
+            with lock:
+                counts['write' if response.status_code == 201 else 'write_error'] += 1
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    threads += [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return counts
+
+
+def main():
+    readers = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    writers = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    seconds = float(sys.argv[3]) if len(sys.argv) > 3 else 5
+
+    print('=' * 60)
+    print(f"混合负载: {readers} 个读线程 + {writers} 个写线程，每轮 {seconds:g} 秒，初始留言 {SEED_MESSAGES} 条")
+    print('=' * 60)
+    results = {}
+    try:
+        for profile in ('default', 'production'):
+            configure(profile, os.path.join(BENCH_DIR, f'{profile}.db'))
+            try:
+                counts = run_load(readers, writers, seconds)
+            finally:
+                with app.app_context():
+                    db.session.remove()
+                    db.get_engine().dispose()
+            results[profile] = counts
+            print(f"[{profile:>10}] 读 {counts['read'] / seconds:8.1f} 次/秒  "
+                  f"写 {counts['write'] / seconds:7.1f} 次/秒  "
+                  f"出错 读{counts['read_error']} 写{counts['write_error']}")
+    finally:
+        cleanup()
+
+    base, prod = results['default'], results['production']
+    if base['read'] and base['write']:
+        print('-' * 60)
+        print(f"读吞吐 x{prod['read'] / base['read']:.2f}，写吞吐 x{prod['write'] / base['write']:.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+微信通知发件箱验证
+在本机启动一个模拟 Server酱 的 HTTP 服务，由真实的后台发送线程投递，检查:
+1. 短时间内陆续产生的一波通知(分多个事务入队)只合并成一条摘要发送
+2. 发送失败的通知按退避间隔(base * 2^(次数-1))重试，成功后不再发送
+3. 一直失败的通知重试 max_attempts 次后标记为 failed，不再发送
+
+用法: python bench_notifications.py
+合并窗口和重试间隔按比例缩短，几秒内跑完；使用临时数据库，不会改动 messages.db，也不会发出真实的微信通知
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+from bench_common import cleanup  # 先于 app 导入：数据库指向临时目录
+from app import (app, db, NotificationOutbox, NOTIFY_CONFIG, SERVERCHAN_CONFIG,
+                 notification_dispatcher, queue_wechat_notification)
+
+COALESCE = 0.5   # 合并窗口(秒)
+BACKOFF = 0.4    # 第一次重试的间隔(秒)
+POLL = 0.05
+SLACK = 0.3      # 允许的调度误差(秒)
+
+
+class StubServerChan(BaseHTTPRequestHandler):
+    """模拟 Server酱：记录收到的每次请求，前 fail_next 次返回失败"""
+    received = []
+    fail_next = 0
+    lock = threading.Lock()
+
+    def do_POST(self):
+        form = parse_qs(self.rfile.read(int(self.headers.get('Content-Length', 0))).decode('utf-8'))
+        with self.lock:
+            StubServerChan.received.append((time.time(), form.get('text', [''])[0]))
+            failed = StubServerChan.fail_next > 0
+            if failed:
+                StubServerChan.fail_next -= 1
+        body = {'code': 1, 'message': '模拟发送失败'} if failed else {'code': 0}
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(500 if failed else 200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def reset_stub(fail_next):
+    with StubServerChan.lock:
+        StubServerChan.received = []
+        StubServerChan.fail_next = fail_next
+
+
+def queue_burst(count, spread_seconds):
+    """在 spread_seconds 秒内分 count 个事务入队，模拟顾客陆续留言"""
+    ids = []
+    for i in range(count):
+        with app.app_context():
+            queue_wechat_notification('message', f'顾客{i}', f'第 {i} 条留言')
+            db.session.commit()
+            ids.append(NotificationOutbox.query.order_by(NotificationOutbox.id.desc()).first().id)
+        time.sleep(spread_seconds / count)
+    return ids
+
+
+def wait_for(ids, statuses, timeout):
+    """等到这些通知都进入 statuses 中的状态，返回 [(状态, 尝试次数)]"""
+    deadline = time.time() + timeout
+    while True:
+        with app.app_context():
+            rows = [(n.status, n.attempts) for n in NotificationOutbox.query.filter(NotificationOutbox.id.in_(ids))]
+            db.session.remove()
+        if all(status in statuses for status, _ in rows) or time.time() > deadline:
+            return rows
+        time.sleep(POLL)
+
+
+def main():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubServerChan)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    SERVERCHAN_CONFIG.update(sckey='bench', api_base=f'http://127.0.0.1:{server.server_port}')
+    NOTIFY_CONFIG.update(coalesce_seconds=COALESCE, poll_seconds=POLL, backoff_base_seconds=BACKOFF,
+                         backoff_max_seconds=BACKOFF * 8, max_attempts=3, timeout=2)
+    notification_dispatcher.ensure_started()
+
+    try:
+        print('=' * 60)
+        reset_stub(0)
+        ids = queue_burst(10, COALESCE * 0.6)
+        rows = wait_for(ids, {'sent', 'failed'}, COALESCE * 4)
+        time.sleep(COALESCE * 2)  # 确认没有多余的投递
+        titles = [title for _, title in StubServerChan.received]
+        print(f"场景一: {COALESCE * 0.6:.1f}s 内陆续入队 10 条通知")
+        print(f"  投递 {len(titles)} 次: {titles}")
+        assert len(titles) == 1 and titles[0] == '🔔 10 条新通知', '一波通知没有合并成一条摘要!'
+        assert rows == [('sent', 1)] * 10, f'通知状态不正确: {rows}'
+
+        reset_stub(2)
+        ids = queue_burst(3, 0)
+        rows = wait_for(ids, {'sent', 'failed'}, COALESCE + BACKOFF * 3 + SLACK * 4)
+        times = [t for t, _ in StubServerChan.received]
+        gaps = [b - a for a, b in zip(times, times[1:])]
+        print("场景二: 模拟 Server酱 前两次返回失败")
+        print(f"  投递 {len(times)} 次，重试间隔 {', '.join(f'{gap:.2f}s' for gap in gaps)}"
+              f"(预期 {BACKOFF:.2f}s, {BACKOFF * 2:.2f}s)，最终状态 {rows[0]}")
+        assert len(times) == 3 and rows == [('sent', 3)] * 3, '失败后没有按次数重试!'
+        for attempt, gap in enumerate(gaps, start=1):
+            expected = BACKOFF * 2 ** (attempt - 1)
+            assert expected - 0.05 <= gap <= expected + SLACK, f'第 {attempt} 次重试间隔 {gap:.2f}s 不符合退避规则!'
+
+        reset_stub(1000)
+        ids = queue_burst(1, 0)
+        rows = wait_for(ids, {'sent', 'failed'}, COALESCE + BACKOFF * 3 + SLACK * 4)
+        time.sleep(BACKOFF * 4)  # 确认标记 failed 之后不再发送
+        print("场景三: 模拟 Server酱 一直失败")
+        print(f"  投递 {len(StubServerChan.received)} 次，最终状态 {rows[0]}")
+        assert len(StubServerChan.received) == 3 and rows == [('failed', 3)], '超过最多重试次数后仍在发送!'
+        print('=' * 60)
+        print('✅ 通知合并、退避重试和放弃重试都符合预期')
+    finally:
+        server.shutdown()
+        cleanup()
+
+
+if __name__ == '__main__':
+    main()
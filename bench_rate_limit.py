@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+限流压测
+1. 单次令牌桶检查的耗时(放行和拒绝两种情况)，以及完整的 check_rate_limit(按 IP + 按会员两个桶)
+2. 多个进程同时开始、在一段时间内交替从同一个桶取令牌(期间持续补充令牌)，
+   检查放行总数等于桶的额度(初始容量 + 期间补充的令牌)，并且每个进程都分到了令牌(各 worker 共用限额)
+
+用法: python bench_rate_limit.py [检查次数] [进程数]
+压测使用临时的限流数据库和网站数据库，不会影响网站正在使用的限流状态，也不会改动 messages.db
+"""
+
+import multiprocessing
+import os
+import sys
+import time
+
+from bench_common import BENCH_DIR, cleanup  # 先于 app 导入：数据库指向临时目录
+from app import app, rate_limiter, check_rate_limit
+
+CAPACITY = 100
+REFILL_RATE = 200       # 每秒补充的令牌数，压测期间补充的令牌比初始容量还多
+CONTEND_SECONDS = 2.0
+
+
+def time_per_call(func, n):
+    started = time.perf_counter()
+    for i in range(n):
+        func(i)
+    return (time.perf_counter() - started) / n * 1e6
+
+
+def contend(idx, barrier, results):
+    """子进程：所有进程就绪后同时开始，CONTEND_SECONDS 秒内不停取令牌，记录放行次数和首末次请求的时间"""
+    barrier.wait()
+    allowed = attempts = 0
+    first = now = time.time()
+    while now - first < CONTEND_SECONDS:
+        attempts += 1
+        if rate_limiter.take('bench:shared', CAPACITY, REFILL_RATE, now=now) == 0:
+            allowed += 1
+        now = time.time()
+    results.put((idx, allowed, attempts, first, now))
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+
+    app.config['RATE_LIMIT_CONFIG'] = dict(app.config['RATE_LIMIT_CONFIG'],
+                                           db_path=os.path.join(BENCH_DIR, 'ratelimit.db'))
+    try:
+        print('=' * 60)
+        print(f"令牌桶检查耗时(每项 {n} 次)")
+        # 放行：每次用不同的 key，桶都是满的
+        allow = time_per_call(lambda i: rate_limiter.take(f'bench:allow:{i % 1000}', 1e9, 1e9), n)
+        # 拒绝：同一个空桶，走 UPSERT + 查询剩余等待时间
+        rate_limiter.take('bench:deny', 1, 0.0001)
+        deny = time_per_call(lambda i: rate_limiter.take('bench:deny', 1, 0.0001), n)
+        app.config['RATE_LIMITS'] = dict(app.config['RATE_LIMITS'], order_ip='1000000000/1',
+                                         order_member='1000000000/1')
+        with app.test_request_context('/api/orders', method='POST', environ_base={'REMOTE_ADDR': '10.0.0.1'}):
+            from flask import session
+            session['member_id'] = 1
+            full = time_per_call(lambda i: check_rate_limit('order'), n)
+        print(f"  放行(一条 UPSERT)            {allow:8.1f} µs/次")
+        print(f"  拒绝(UPSERT + 查询等待时间)  {deny:8.1f} µs/次")
+        print(f"  check_rate_limit(IP + 会员)  {full:8.1f} µs/请求")
+
+        print('-' * 60)
+        rate_limiter.reset()
+        ctx = multiprocessing.get_context('fork')
+        barrier = ctx.Barrier(processes)
+        results = ctx.Queue()
+        workers = [ctx.Process(target=contend, args=(i, barrier, results)) for i in range(processes)]
+        for worker in workers:
+            worker.start()
+        rows = sorted(results.get() for _ in workers)
+        for worker in workers:
+            worker.join()
+
+        allowed = [row[1] for row in rows]
+        attempts = sum(row[2] for row in rows)
+        elapsed = max(row[4] for row in rows) - min(row[3] for row in rows)
+        budget = CAPACITY + REFILL_RATE * elapsed
+        print(f"{processes} 个进程同时取令牌 {elapsed:.2f}s，共请求 {attempts} 次")
+        print(f"  桶容量 {CAPACITY}，每秒补充 {REFILL_RATE}，额度 {budget:.1f}")
+        print(f"  各进程放行 {allowed}，合计 {sum(allowed)}")
+        # 额度内的令牌全部被取走(请求远多于令牌)，也没有多放行；每个进程都分到了令牌说明确实在竞争同一个桶
+        assert budget * 0.95 - 1 <= sum(allowed) <= budget + 1, '多进程放行次数与桶额度不一致!'
+        assert all(allowed), '有进程没有取到令牌，没有形成竞争!'
+        print('=' * 60)
+        print('✅ 多个进程共用同一个限额')
+    finally:
+        cleanup()
+
+
+if __name__ == '__main__':
+    main()
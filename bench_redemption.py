@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+积分兑换并发压测
+N 个会员同时兑换同一件限量商品(默认模拟库存 5 份的 手冲咖啡体验课)，
+检查库存没有超卖、积分没有透支，并统计每秒完成的兑换数
+
+用法: python bench_redemption.py [并发人数] [库存]
+压测使用临时数据库，不会改动 messages.db
+"""
+
+import os
+import sys
+import threading
+import time
+
+from bench_common import BENCH_DIR, cleanup  # 先于 app 导入：数据库指向临时目录
+from app import app, db, Member, RedemptionItem, Redemption, PointRecord
+
+ITEM_NAME = '手冲咖啡体验课'
+ITEM_COST = 800
+
+
+def setup_database(db_path, redeemers, stock):
+    """创建临时数据库：一件限量商品，redeemers 个积分充足的会员，外加一个只够兑换两次的会员"""
+    app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
+    app.config['NOTIFY_DISPATCHER_ENABLED'] = False
+    with app.app_context():
+        db.create_all()
+        scarce = RedemptionItem(name=ITEM_NAME, points_required=ITEM_COST, stock=stock)
+        plenty = RedemptionItem(name='美式咖啡券', points_required=50, stock=100000)
+        db.session.add_all([scarce, plenty])
+        for i in range(redeemers):
+            db.session.add(Member(username=f'bench{i}', email=f'bench{i}@example.com',
+                                  password='x', points=ITEM_COST * 2))
+        db.session.add(Member(username='bench_poor', email='bench_poor@example.com',
+                              password='x', points=100))
+        db.session.commit()
+        return scarce.id, plenty.id
+
+
+def run_concurrent(requests_per_thread):
+    """
+    每个线程用自己的测试客户端登录对应会员，等所有线程就绪后同时发起兑换
+    requests_per_thread: [(member_id, item_id), ...]
+    返回 (各请求状态码列表, 耗时秒数)
+    """
+    barrier = threading.Barrier(len(requests_per_thread) + 1)
+    results = [None] * len(requests_per_thread)
+
+    def worker(idx, member_id, item_id):
+        client = app.test_client()
+        with client.session_transaction() as sess:
+            sess['member_id'] = member_id
+        barrier.wait()
+        response = client.post('/api/redemption/redeem', json={'item_id': item_id})
+        results[idx] = response.status_code
+
+    threads = [threading.Thread(target=worker, args=(i, member_id, item_id))
+               for i, (member_id, item_id) in enumerate(requests_per_thread)]
+    for t in threads:
+        t.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for t in threads:
+        t.join()
+    return results, time.perf_counter() - started
+
+
+def main():
+    redeemers = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    stock = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    db_path = os.path.join(BENCH_DIR, 'bench.db')
+    try:
+        scarce_id, plenty_id = setup_database(db_path, redeemers, stock)
+        with app.app_context():
+            member_ids = [m.id for m in Member.query.filter(Member.username.like('bench%')).all()
+                          if m.username != 'bench_poor']
+            poor_id = Member.query.filter_by(username='bench_poor').first().id
+
+        # 场景一: redeemers 人抢 stock 份限量商品
+        codes, elapsed = run_concurrent([(mid, scarce_id) for mid in member_ids])
+        ok = codes.count(200)
+        with app.app_context():
+            item = RedemptionItem.query.get(scarce_id)
+            redeemed = Redemption.query.filter_by(item_id=scarce_id).count()
+            negative = Member.query.filter(Member.points < 0).count()
+        print('=' * 50)
+        print(f"场景一: {redeemers} 人同时兑换 {ITEM_NAME}(库存 {stock})")
+        print(f"  成功 {ok} / 失败 {len(codes) - ok}，状态码: "
+              f"{ {code: codes.count(code) for code in sorted(set(codes))} }")
+        print(f"  剩余库存 {item.stock}，兑换记录 {redeemed} 条，积分为负的会员 {negative} 个")
+        print(f"  耗时 {elapsed:.3f}s，{len(codes) / elapsed:.1f} 请求/秒，{ok / elapsed:.1f} 兑换/秒")
+        assert ok == stock and item.stock == 0 and redeemed == stock and negative == 0, '出现超卖或透支!'
+
+        # 场景二: 同一会员(积分只够兑换两次)并发提交 20 次兑换
+        codes, elapsed = run_concurrent([(poor_id, plenty_id)] * 20)
+        ok = codes.count(200)
+        with app.app_context():
+            poor = Member.query.get(poor_id)
+            spent = db.session.query(db.func.sum(PointRecord.points)).filter_by(member_id=poor_id).scalar() or 0
+        print(f"场景二: 积分 100 的会员并发兑换 20 次 50 积分的商品")
+        print(f"  成功 {ok} 次，剩余积分 {poor.points}，积分记录合计 {spent}")
+        print(f"  耗时 {elapsed:.3f}s，{len(codes) / elapsed:.1f} 请求/秒")
+        assert ok == 2 and poor.points == 0 and spent == -100, '出现积分透支!'
+        print('=' * 50)
+        print('✅ 没有超卖，也没有透支积分')
+    finally:
+        cleanup()
+
+
+if __name__ == '__main__':
+    main()
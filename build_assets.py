@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+静态资源构建
+把 css/style.css、js/*.js 压缩后按内容加上指纹(如 dist/js/feedback.1a2b3c4d5e.js)，
+顶层 HTML 页面改写为引用带指纹的文件名后写入 dist/，每个文件同时生成 .gz 和 .br 预压缩版本，
+CSS 中相对路径的 url() 改写为以 / 开头的路径(文件移到 dist/ 后相对路径会失效)，
+最后写出 dist/manifest.json。网站启动时读取清单，优先发送预压缩文件，带指纹的文件可以让浏览器缓存一年
+
+用法: python build_assets.py
+修改 css/js/html 后重新运行并重启网站；没有 dist/manifest.json 时网站直接使用原文件
+生成 .br 需要 brotli: pip install brotli(没有安装时只生成 .gz)
+"""
+
+import glob
+import gzip
+import hashlib
+import json
+import os
+import posixpath
+import re
+import shutil
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DIST_DIR = 'dist'
+MANIFEST_PATH = os.path.join(DIST_DIR, 'manifest.json')
+ASSETS = ['css/style.css'] + sorted(glob.glob('js/*.js'))
+PAGES = sorted(glob.glob('*.html'))
+
+# HTML 中引用 css/js 的属性，如 href="css/style.css"、src="./js/main.js"
+ASSET_REF_RE = re.compile(r'''(\b(?:href|src)=["'])(?:\./|/)?((?:css|js)/[^"'?#]+)(["'])''')
+# CSS 中的 url(...)，如 url('../images/a.jpg')
+CSS_URL_RE = re.compile(r'''url\(\s*(["']?)([^"')]+)\1\s*\)''')
+# 内联脚本：<script> 标签和标签内的代码
+INLINE_SCRIPT_RE = re.compile(r'(<script\b[^>]*>)(.*?)(?=</script>)', re.S | re.I)
+# 这些字符或关键字后面的 / 是正则字面量的开始，其余情况是除号
+JS_REGEX_PREFIX = set('(,=:[!&|?{};+-*%<>~^') | {''}
+JS_REGEX_KEYWORDS = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete',
+                     'void', 'throw', 'yield', 'await', 'instanceof'}
+
+
+def minify_css(text):
+    """去掉注释和多余空白"""
+    text = re.sub(r'/\*.*?\*/', '', text, flags=re.S)
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'\s*([{};,])\s*', r'\1', text)
+    return text.replace(';}', '}').strip() + '\n'
+
+
+def rewrite_css_urls(text, asset):
+    """CSS 中的相对路径是相对 CSS 文件本身的，构建后文件移到 dist/css/ 下会找不到，
+    这里按原文件位置改写成以 / 开头的绝对路径(如 ../images/a.jpg -> /images/a.jpg)"""
+    base = posixpath.dirname('/' + asset)
+
+    def rewrite(match):
+        quote, url = match.group(1), match.group(2).strip()
+        if url.startswith(('/', '#', 'data:')) or re.match(r'^[a-z][a-z0-9+.-]*:', url, re.I):
+            return match.group(0)
+        return f"url({quote}{posixpath.normpath(posixpath.join(base, url))}{quote})"
+
+    return CSS_URL_RE.sub(rewrite, text)
+
+
+def js_literal_lines(text):
+    """
+    逐字符扫描 JS，返回每一行开头是否处在字符串里(多行的模板字符串，或以 \\ 续行的普通字符串)
+    跳过注释和正则字面量，模板字符串里 ${...} 的嵌套也按代码扫描
+    """
+    starts = [False]
+    mode = 'code'   # code / line_comment / block_comment / regex，或当前字符串的引号 ' " `
+    braces = []     # 代码里未闭合的 {，'${' 表示模板字符串里的插值
+    prev = ''       # 上一个有意义的字符，标识符记为 'a'，用来区分除号和正则
+    word = ''       # 上一个标识符
+    in_class = False
+    i, n = 0, len(text)
+    while i < n:
+        c = text[i]
+        if c == '\n':
+            if mode == 'line_comment':
+                mode = 'code'
+            starts.append(mode in ('"', "'", '`'))
+        elif mode == 'code':
+            nxt = text[i + 1:i + 2]
+            if c in '"\'`':
+                mode = c
+            elif c == '/' and nxt == '/':
+                mode = 'line_comment'
+            elif c == '/' and nxt == '*':
+                mode = 'block_comment'
+                i += 1
+            elif c == '/' and (prev in JS_REGEX_PREFIX or (prev == 'a' and word in JS_REGEX_KEYWORDS)):
+                mode, in_class = 'regex', False
+            elif c == '{':
+                braces.append('{')
+            elif c == '}' and braces and braces.pop() == '${':
+                mode = '`'
+            if not c.isspace():
+                if c.isalnum() or c in '_$':
+                    word = word + c if prev == 'a' else c
+                    prev = 'a'
+                else:
+                    prev = c
+        elif c == '\\' and mode in ('"', "'", '`', 'regex'):
+            i += 1  # 转义字符(包括续行的换行)
+            if text[i:i + 1] == '\n':
+                starts.append(True)
+        elif mode == 'block_comment':
+            if c == '*' and text[i + 1:i + 2] == '/':
+                mode = 'code'
+                i += 1
+        elif mode == 'regex':
+            if c == '[':
+                in_class = True
+            elif c == ']':
+                in_class = False
+            elif c == '/' and not in_class:
+                mode, prev = 'code', 'a'  # 正则之后的 / 是除号
+        elif mode == '`' and c == '$' and text[i + 1:i + 2] == '{':
+            braces.append('${')
+            mode, prev = 'code', '{'
+            i += 1
+        elif c == mode and mode in ('"', "'", '`'):
+            mode, prev = 'code', c
+        i += 1
+    return starts
+
+
+def minify_js(text):
+    """
+    只去掉每行的缩进和空行，不改动代码本身，保证不会因为压缩出错；
+    多行模板字符串里的内容(生成页面 HTML 的文本)保持原样
+    """
+    lines = text.split('\n')
+    starts = js_literal_lines(text)
+    result = []
+    for index, line in enumerate(lines):
+        starts_inside = starts[index]
+        ends_inside = index + 1 < len(starts) and starts[index + 1]
+        if starts_inside and ends_inside:
+            result.append(line)
+        elif starts_inside:
+            result.append(line.rstrip())
+        elif ends_inside:
+            result.append(line.lstrip())
+        elif line.strip():
+            result.append(line.strip())
+    return '\n'.join(result) + '\n' if result else ''
+
+
+def minify_html(text):
+    """去掉每行的缩进和空行；<textarea>/<pre> 内的内容保持原样，内联 <script> 按 JS 压缩"""
+    result = []
+    last = 0
+    for match in INLINE_SCRIPT_RE.finditer(text):
+        if not match.group(2).strip():
+            continue
+        result.append(minify_markup(text[last:match.end(1)]))
+        result.append(minify_js(match.group(2)))
+        last = match.end(2)
+    result.append(minify_markup(text[last:]))
+    return ''.join(result)
+
+
+def minify_markup(text):
+    """去掉每行的缩进和空行(<textarea>/<pre> 内的内容保持原样)"""
+    result = []
+    preserve = False
+    for line in text.splitlines():
+        if preserve:
+            result.append(line)
+        elif line.strip():
+            result.append(line.strip())
+        opened = len(re.findall(r'<(?:textarea|pre)\b', line, re.I))
+        closed = len(re.findall(r'</(?:textarea|pre)>', line, re.I))
+        if opened > closed:
+            preserve = True
+        elif closed > opened:
+            preserve = False
+    return '\n'.join(result) + '\n'
+
+
+def write_variants(path, data):
+    """写出文件本身以及 .gz / .br 预压缩版本"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(data)
+    with open(path + '.gz', 'wb') as f:
+        # mtime=0 让相同内容生成相同的 .gz
+        f.write(gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli is not None:
+        with open(path + '.br', 'wb') as f:
+            f.write(brotli.compress(data, quality=11))
+
+
+def build():
+    if os.path.isdir(DIST_DIR):
+        shutil.rmtree(DIST_DIR)
+    manifest = {}
+    total_before = total_after = 0
+
+    for asset in ASSETS:
+        with open(asset, encoding='utf-8') as f:
+            source = f.read()
+        if asset.endswith('.css'):
+            minified = minify_css(rewrite_css_urls(source, asset)).encode('utf-8')
+        else:
+            minified = minify_js(source).encode('utf-8')
+        digest = hashlib.sha256(minified).hexdigest()[:10]
+        base, ext = os.path.splitext(asset)
+        target = f"{DIST_DIR}/{base}.{digest}{ext}"
+        write_variants(target, minified)
+        manifest[asset] = target
+        total_before += len(source.encode('utf-8'))
+        total_after += len(gzip.compress(minified, 9))
+        print(f"  {asset:<24} -> {target}")
+
+    def rewrite(match):
+        asset = match.group(2)
+        return match.group(1) + manifest.get(asset, asset) + match.group(3)
+
+    for page in PAGES:
+        with open(page, encoding='utf-8') as f:
+            source = f.read()
+        html = minify_html(ASSET_REF_RE.sub(rewrite, source)).encode('utf-8')
+        target = f"{DIST_DIR}/{page}"
+        write_variants(target, html)
+        manifest[page] = target
+        total_before += len(source.encode('utf-8'))
+        total_after += len(gzip.compress(html, 9))
+        print(f"  {page:<24} -> {target}")
+
+    with open(MANIFEST_PATH, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return manifest, total_before, total_after
+
+
+if __name__ == '__main__':
+    print("=" * 50)
+    print("五月咖啡 - 构建静态资源")
+    print("=" * 50)
+    if brotli is None:
+        print("⚠️  未安装 brotli，只生成 .gz(pip install brotli 后可生成 .br)")
+    manifest, before, after = build()
+    print(f"\n✅ 共 {len(manifest)} 个文件，原始 {before / 1024:.1f} KB，压缩后(gzip) {after / 1024:.1f} KB")
+    print(f"📄 清单已写入 {MANIFEST_PATH}，重启网站后生效")
@@ -17,7 +17,7 @@ KEY="$HOME/.ssh/maycoffee_deploy"
 SSH_OPTS="-i $KEY -o StrictHostKeyChecking=no -o ConnectTimeout=20"
 
 echo ""
-echo "==> 1/3 提交并推送到 GitHub ..."
+echo "==> 1/4 提交并推送到 GitHub ..."
 git add -A
 if git diff --cached --quiet; then
     echo "    （没有新的改动需要提交）"
@@ -31,7 +31,12 @@ else
 fi
 
 echo ""
-echo "==> 2/3 同步文件到服务器 ..."
+echo "==> 2/4 构建静态资源（压缩、加指纹、生成 .gz/.br）..."
+python3 build_assets.py > /dev/null
+echo "    已生成 dist/"
+
+echo ""
+echo "==> 3/4 同步文件到服务器 ..."
 rsync -az --no-perms --no-owner --no-group --timeout=120 \
     --exclude '.git' \
     --exclude 'venv' \
@@ -41,6 +46,7 @@ rsync -az --no-perms --no-owner --no-group --timeout=120 \
     --exclude '__pycache__' \
     --exclude '*.pyc' \
     --exclude 'messages.db' \
+    --exclude 'messages.db-*' \
     --exclude '*.sqlite' \
     --exclude 'instance' \
     --exclude 'uploads' \
@@ -50,7 +56,7 @@ rsync -az --no-perms --no-owner --no-group --timeout=120 \
     ./ "$SERVER:$APP_DIR/"
 
 echo ""
-echo "==> 3/3 重启网站服务 ..."
+echo "==> 4/4 重启网站服务 ..."
 ssh $SSH_OPTS "$SERVER" "systemctl restart maycoffee && sleep 2 && systemctl is-active maycoffee"
 
 echo ""
@@ -120,6 +120,12 @@ server {
         alias /var/www/maycoffee/;
         expires 30d;
     }
+
+    # uploads/ 和 images/ 由 app 检查后通过 X-Accel-Redirect 交给 Nginx 直接发送
+    location /_protected_media/ {
+        internal;
+        alias /var/www/maycoffee/;
+    }
 }
 NGINX_CONFIG
 
@@ -152,7 +158,8 @@ After=network.target
 User=root
 WorkingDirectory=/var/www/maycoffee
 Environment="PATH=/var/www/maycoffee/venv/bin"
-ExecStart=/var/www/maycoffee/venv/bin/gunicorn -w 4 -b 127.0.0.1:8000 app:app
+Environment="MEDIA_OFFLOAD=x-accel"
+ExecStart=/var/www/maycoffee/venv/bin/gunicorn -w 4 -k gthread --threads 8 -b 127.0.0.1:8000 app:app
 Restart=always
 RestartSec=10
 StandardOutput=journal
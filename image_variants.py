@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+图片缩略图生成
+在 app.py 的图片处理进程池中运行。本模块只依赖 Pillow，导入时不会建表、执行迁移或启动后台线程，
+进程池的子进程只导入这个模块，不会导入 app
+"""
+
+import os
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # 未安装 Pillow 时不生成缩略图，页面直接使用原图
+    Image = ImageOps = None
+
+IMAGE_VARIANTS = {
+    # 名称: (最长边像素, JPEG 质量)
+    'thumb': (320, 75),     # 列表页
+    'medium': (1280, 82),   # 详情页
+}
+IMAGE_VARIANT_SOURCES = ('.png', '.jpg', '.jpeg', '.webp', '.bmp')     # GIF 可能是动图，保留原图
+
+def image_variant_paths(path):
+    """原图对应的各尺寸缩略图路径，如 uploads/ab/cd/<sha256>_thumb.jpg"""
+    base = os.path.splitext(path)[0]
+    return {name: f"{base}_{name}.jpg" for name in IMAGE_VARIANTS}
+
+def generate_image_variants(path):
+    """
+    在图片处理进程中运行：生成一张图片的各尺寸缩略图，返回 {名称: 路径}
+    缩略图已经存在(相同图片之前上传过)时直接返回
+    """
+    targets = image_variant_paths(path)
+    if all(os.path.exists(target) for target in targets.values()):
+        return targets
+    with Image.open(path) as original:
+        image = ImageOps.exif_transpose(original)  # 手机照片按 EXIF 方向摆正
+        if image.mode in ('RGBA', 'LA', 'P'):
+            # JPEG 不支持透明，铺白色底
+            image = image.convert('RGBA')
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            background.paste(image, mask=image.split()[-1])
+            image = background
+        elif image.mode != 'RGB':
+            image = image.convert('RGB')
+        for name, (max_side, quality) in IMAGE_VARIANTS.items():
+            variant = image.copy()
+            variant.thumbnail((max_side, max_side), Image.LANCZOS)  # 只缩小不放大
+            tmp_path = f"{targets[name]}.{os.getpid()}.tmp"
+            variant.save(tmp_path, 'JPEG', quality=quality, optimize=True, progressive=True)
+            os.replace(tmp_path, targets[name])
+    return targets
+
+def generate_all(paths):
+    """进程池任务：为一条记录的所有图片生成缩略图，单张失败不影响其他图片"""
+    result = {}
+    for path in paths:
+        try:
+            result[path] = generate_image_variants(path)
+        except Exception as e:
+            print(f"⚠️  生成缩略图失败 {path}: {str(e)}")
+    return result
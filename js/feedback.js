@@ -3,6 +3,9 @@ let currentMessageId = null;
 let selectedFiles = { image: null, video: null, files: [] };
 let postFiles = { images: [], video: null, files: [] };  // 发帖文件，支持多张图片和多个文件
 let currentUser = { name: '', email: '' };
+let loadedMessages = [];  // 已加载的留言(按时间倒序，可能包含多页)
+let nextCursor = null;    // 下一页(更早留言)的游标，null 表示已全部加载
+let searchQuery = '';     // 当前搜索词，为空时显示留言列表
 
 // ========== 用户信息管理 ==========
 function loadUserInfo() {
@@ -138,6 +141,63 @@ function clearPostForm() {
     document.getElementById('postMediaPreview').innerHTML = '';
 }
 
+// ========== 视频分片上传 ==========
+// 视频按片上传，网络中断后从服务端记录的偏移继续；同一个文件刷新页面后也能续传
+const UPLOAD_RETRY_LIMIT = 5;
+
+async function uploadVideoInChunks(file, onProgress) {
+    const resumeKey = `chunkedUpload:${file.name}:${file.size}:${file.lastModified}`;
+    let upload = null;
+    
+    // 之前没传完的同一个文件，先查询进度
+    const savedId = localStorage.getItem(resumeKey);
+    if (savedId) {
+        const res = await fetch(`/api/uploads/${savedId}`);
+        if (res.ok) upload = await res.json();
+    }
+    if (!upload) {
+        const res = await fetch('/api/uploads', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ filename: file.name, size: file.size })
+        });
+        upload = await res.json();
+        if (!res.ok) throw new Error(upload.error || '视频上传失败');
+        localStorage.setItem(resumeKey, upload.upload_id);
+    }
+    
+    const chunkSize = upload.chunk_size || 4 * 1024 * 1024;
+    let offset = upload.offset;
+    let failures = 0;
+    while (upload.status !== 'complete' && offset < file.size) {
+        try {
+            const res = await fetch(`/api/uploads/${upload.upload_id}?offset=${offset}`, {
+                method: 'PUT',
+                headers: { 'Content-Type': 'application/octet-stream' },
+                body: file.slice(offset, offset + chunkSize)
+            });
+            const data = await res.json();
+            if (!res.ok && res.status !== 409) throw new Error(data.error || '视频上传失败');
+            // 409 表示偏移不一致，按服务端记录的偏移继续
+            offset = data.offset;
+            failures = 0;
+        } catch (error) {
+            if (++failures > UPLOAD_RETRY_LIMIT) throw error;
+            await new Promise(resolve => setTimeout(resolve, 1000 * failures));
+            const res = await fetch(`/api/uploads/${upload.upload_id}`);
+            if (!res.ok) throw new Error('视频上传已失效，请重新选择文件');
+            offset = (await res.json()).offset;
+        }
+        if (onProgress) onProgress(offset / file.size);
+    }
+    
+    const res = await fetch(`/api/uploads/${upload.upload_id}/finalize`, { method: 'POST' });
+    const data = await res.json();
+    if (!res.ok) throw new Error(data.error || '视频上传失败');
+    localStorage.removeItem(resumeKey);
+    return upload.upload_id;
+}
+
 async function submitPost() {
     const title = document.getElementById('postTitle').value.trim();
     const content = document.getElementById('postContent').value.trim();
@@ -170,10 +230,6 @@ async function submitPost() {
         });
     }
     
-    if (postFiles.video) {
-        formData.append('video', postFiles.video);
-    }
-    
     // 添加多个文件
     if (postFiles.files && postFiles.files.length > 0) {
         postFiles.files.forEach((file) => {
@@ -186,6 +242,15 @@ async function submitPost() {
     submitBtn.textContent = '发帖中...';
     
     try {
+        // 视频先分片上传，留言里只带上传 ID
+        if (postFiles.video) {
+            const uploadId = await uploadVideoInChunks(postFiles.video, progress => {
+                submitBtn.textContent = `视频上传中 ${Math.floor(progress * 100)}%`;
+            });
+            formData.append('video_upload_id', uploadId);
+            submitBtn.textContent = '发帖中...';
+        }
+        
         const response = await fetch('/api/messages', {
             method: 'POST',
             body: formData
@@ -209,49 +274,181 @@ async function submitPost() {
 }
 
 
-// 加载并显示所有留言
+// 判断留言 a 是否排在 b 之后(更早)，与服务端 (created_at, id) 倒序一致
+function isOlderMessage(a, b) {
+    if (a.created_at !== b.created_at) {
+        return a.created_at < b.created_at;
+    }
+    return a.id < b.id;
+}
+
+// 加载第一页留言；已经加载过的更早留言会保留下来
 async function loadMessages() {
     const container = document.getElementById('messagesContainer');
     
     try {
         const response = await fetch('/api/messages');
-        const messages = await response.json();
+        const data = await response.json();
+        const firstPage = data.messages || [];
+
+        // 轮询刷新时只替换第一页，保留用户已经翻出来的更早留言
+        const firstIds = new Set(firstPage.map(m => m.id));
+        const last = firstPage[firstPage.length - 1];
+        const olderLoaded = last && data.has_more
+            ? loadedMessages.filter(m => !firstIds.has(m.id) && isOlderMessage(m, last))
+            : [];
+        loadedMessages = firstPage.concat(olderLoaded);
+        if (olderLoaded.length === 0) {
+            nextCursor = data.next_cursor;
+        }
 
-        if (messages.length === 0) {
-            container.innerHTML = '<div class="no-messages">暂无留言，成为第一个留言的人吧！</div>';
-            return;
+        // 正在显示搜索结果时，轮询只更新数据，不覆盖搜索结果
+        if (!searchQuery) {
+            renderMessageList();
         }
+    } catch (error) {
+        if (searchQuery) return;
+        container.innerHTML = '<div class="no-messages">加载失败，请刷新重试</div>';
+        console.error('Error loading messages:', error);
+    }
+}
 
-        container.innerHTML = messages.map(msg => `
-            <div class="message-item" onclick="viewMessageDetail(${msg.id})" style="cursor: pointer;">
-                <div style="margin-bottom: 10px;">
-                    <h4 style="margin: 0 0 8px 0; color: #333; font-size: 16px; font-weight: bold;">${escapeHtml(msg.title)}</h4>
-                    <div class="message-header">
-                        <span class="message-name">${escapeHtml(msg.name)}</span>
-                        <span class="message-time">${msg.created_at}</span>
-                    </div>
+// 加载更早的一页留言
+async function loadMoreMessages() {
+    if (!nextCursor) return;
+    
+    const moreBtn = document.getElementById('loadMoreBtn');
+    if (moreBtn) {
+        moreBtn.disabled = true;
+        moreBtn.textContent = '加载中...';
+    }
+    
+    try {
+        const response = await fetch(`/api/messages?cursor=${encodeURIComponent(nextCursor)}`);
+        const data = await response.json();
+        const loadedIds = new Set(loadedMessages.map(m => m.id));
+        loadedMessages = loadedMessages.concat((data.messages || []).filter(m => !loadedIds.has(m.id)));
+        nextCursor = data.next_cursor;
+        renderMessageList();
+    } catch (error) {
+        console.error('Error loading more messages:', error);
+        if (moreBtn) {
+            moreBtn.disabled = false;
+            moreBtn.textContent = '加载失败，点击重试';
+        }
+    }
+}
+
+// 渲染已加载的留言列表
+function renderMessageList() {
+    const container = document.getElementById('messagesContainer');
+
+    if (loadedMessages.length === 0) {
+        container.innerHTML = '<div class="no-messages">暂无留言，成为第一个留言的人吧！</div>';
+        return;
+    }
+
+    container.innerHTML = loadedMessages.map(msg => `
+        <div class="message-item" onclick="viewMessageDetail(${msg.id})" style="cursor: pointer;">
+            <div style="margin-bottom: 10px;">
+                <h4 style="margin: 0 0 8px 0; color: #333; font-size: 16px; font-weight: bold;">${escapeHtml(msg.title)}</h4>
+                <div class="message-header">
+                    <span class="message-name">${escapeHtml(msg.name)}</span>
+                    <span class="message-time">${msg.created_at}</span>
                 </div>
-                <div class="message-content">${escapeHtml(msg.content).replace(/\n/g, '<br>')}</div>
-                <div style="margin-top: 10px; color: #8B6F47; font-size: 14px;">点击查看详情和回复 →</div>
             </div>
-        `).join('');
+            <div class="message-content">${escapeHtml(msg.content).replace(/\n/g, '<br>')}</div>
+            <div style="margin-top: 10px; color: #8B6F47; font-size: 14px;">点击查看详情和回复 →</div>
+        </div>
+    `).join('') + (nextCursor ? `
+        <div style="text-align: center; margin: 20px 0;">
+            <button id="loadMoreBtn" onclick="loadMoreMessages()" style="padding: 10px 30px; background: #8B6F47; color: white; border: none; border-radius: 4px; cursor: pointer; font-size: 14px;">加载更早的留言</button>
+        </div>
+    ` : '');
+}
+
+// ========== 留言搜索 ==========
+// 由服务端全文索引查找留言标题、内容和回复，返回的 title/snippet 已转义，匹配词用 <mark> 标出
+async function searchMessages(page = 1) {
+    const q = document.getElementById('searchInput').value.trim();
+    if (!q) {
+        clearSearch();
+        return;
+    }
+    searchQuery = q;
+
+    const container = document.getElementById('messagesContainer');
+    container.innerHTML = '<div class="loading"><div class="spinner"></div><p>搜索中...</p></div>';
+
+    try {
+        const response = await fetch(`/api/messages/search?q=${encodeURIComponent(q)}&page=${page}`);
+        const data = await response.json();
+        if (searchQuery !== q) return;  // 等待结果期间又换了搜索词
+        if (!response.ok) {
+            container.innerHTML = `<div class="no-messages">${escapeHtml(data.error || '搜索失败，请重试')}</div>`;
+            return;
+        }
+        renderSearchResults(q, data);
     } catch (error) {
-        container.innerHTML = '<div class="no-messages">加载失败，请刷新重试</div>';
-        console.error('Error loading messages:', error);
+        container.innerHTML = '<div class="no-messages">搜索失败，请重试</div>';
+        console.error('Error searching messages:', error);
     }
 }
 
+function renderSearchResults(q, data) {
+    const container = document.getElementById('messagesContainer');
+    const results = data.results || [];
+    const buttonStyle = 'padding: 8px 20px; background: #8B6F47; color: white; border: none; border-radius: 4px; cursor: pointer; font-size: 14px; margin: 0 5px;';
+
+    const header = `
+        <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 15px; color: #666; font-size: 14px;">
+            <span>“${escapeHtml(q)}” 的搜索结果${data.page > 1 ? `(第 ${data.page} 页)` : ''}</span>
+            <a href="javascript:void(0)" onclick="clearSearch()" style="color: #8B6F47;">✕ 清除搜索</a>
+        </div>
+    `;
+
+    if (results.length === 0) {
+        container.innerHTML = header + '<div class="no-messages">没有找到相关的留言或回复</div>';
+        return;
+    }
+
+    container.innerHTML = header + results.map(r => `
+        <div class="message-item" onclick="viewMessageDetail(${r.message_id})" style="cursor: pointer;">
+            <div style="margin-bottom: 10px;">
+                <h4 style="margin: 0 0 8px 0; color: #333; font-size: 16px; font-weight: bold;">${r.title}</h4>
+                <div class="message-header">
+                    <span class="message-name">${r.type === 'reply' ? '💬 回复 · ' : ''}${escapeHtml(r.name)}</span>
+                    <span class="message-time">${r.created_at}</span>
+                </div>
+            </div>
+            <div class="message-content">${r.snippet}</div>
+            <div style="margin-top: 10px; color: #8B6F47; font-size: 14px;">点击查看详情和回复 →</div>
+        </div>
+    `).join('') + ((data.page > 1 || data.has_more) ? `
+        <div style="text-align: center; margin: 20px 0;">
+            ${data.page > 1 ? `<button onclick="searchMessages(${data.page - 1})" style="${buttonStyle}">← 上一页</button>` : ''}
+            ${data.has_more ? `<button onclick="searchMessages(${data.page + 1})" style="${buttonStyle}">下一页 →</button>` : ''}
+        </div>
+    ` : '');
+}
+
+function clearSearch() {
+    searchQuery = '';
+    document.getElementById('searchInput').value = '';
+    renderMessageList();
+}
+
 // 查看留言详情
 async function viewMessageDetail(messageId) {
     currentMessageId = messageId;
     
     try {
         // 获取留言详情
-        const response = await fetch('/api/messages');
-        const messages = await response.json();
-        const message = messages.find(m => m.id === messageId);
+        const response = await fetch(`/api/messages/${messageId}`);
+        const data = await response.json();
+        const message = data.message;
         
-        if (!message) {
+        if (!response.ok || !message) {
             alert('留言不存在');
             return;
         }
@@ -265,7 +462,7 @@ async function viewMessageDetail(messageId) {
         let imagesHtml = '';
         if (message.image_paths && message.image_paths.length > 0) {
             imagesHtml = '<div class="message-detail-media">' + 
-                message.image_paths.map(img => `<img src="${img}" alt="留言图片">`).join('') + 
+                message.image_paths.map((img, i) => `<a href="${img}" target="_blank"><img src="${(message.image_mediums || [])[i] || img}" alt="留言图片"></a>`).join('') + 
                 '</div>';
         } else if (message.image_path) {
             // 兼容旧数据
@@ -446,15 +643,20 @@ async function submitQuickReply() {
         formData.append('image', selectedFiles.image);
     }
     
-    if (selectedFiles.video) {
-        formData.append('video', selectedFiles.video);
-    }
-    
     const submitBtn = document.getElementById('quickSubmitBtn');
     submitBtn.disabled = true;
     submitBtn.textContent = '发送中...';
     
     try {
+        // 视频先分片上传，回复里只带上传 ID
+        if (selectedFiles.video) {
+            const uploadId = await uploadVideoInChunks(selectedFiles.video, progress => {
+                submitBtn.textContent = `视频 ${Math.floor(progress * 100)}%`;
+            });
+            formData.append('video_upload_id', uploadId);
+            submitBtn.textContent = '发送中...';
+        }
+        
         const response = await fetch(`/api/messages/${currentMessageId}/replies`, {
             method: 'POST',
             body: formData
@@ -4,25 +4,62 @@ let allMessages = [];
 let filteredMessages = [];
 let currentPage = 1;
 let currentSort = 'newest';
+let totalMessages = 0;   // 服务端统计的留言总数
+let nextCursor = null;   // 下一批更早留言的游标，null 表示已全部加载
 
-// 加载留言
+// 判断留言 a 是否排在 b 之后(更早)，与服务端 (created_at, id) 倒序一致
+function isOlderMessage(a, b) {
+    if (a.created_at !== b.created_at) {
+        return a.created_at < b.created_at;
+    }
+    return a.id < b.id;
+}
+
+// 加载留言(第一批)；已经加载过的更早留言会保留下来
 async function loadMessages() {
     try {
-        const response = await fetch('/api/messages');
-        allMessages = await response.json();
-        filteredMessages = allMessages;
-        updateStats();
-        currentPage = 1;
-        renderMessages();
+        const response = await fetch(`/api/messages?limit=${ITEMS_PER_PAGE * 5}`);
+        const data = await response.json();
+        const firstBatch = data.messages || [];
+
+        // 轮询刷新时只替换第一批，保留用户已经加载的更早留言
+        const firstIds = new Set(firstBatch.map(m => m.id));
+        const last = firstBatch[firstBatch.length - 1];
+        const olderLoaded = last && data.has_more
+            ? allMessages.filter(m => !firstIds.has(m.id) && isOlderMessage(m, last))
+            : [];
+        allMessages = firstBatch.concat(olderLoaded);
+        totalMessages = data.total || allMessages.length;
+        if (olderLoaded.length === 0) {
+            nextCursor = data.next_cursor;
+        }
+        // 重新套用当前的搜索条件，停留在当前页
+        searchMessages(false);
     } catch (error) {
         console.error('Error loading messages:', error);
         document.getElementById('messagesContainer').innerHTML = '<div class="no-messages">加载失败，请刷新重试</div>';
     }
 }
 
+// 从服务端加载更早的一批留言
+async function loadMoreMessages() {
+    if (!nextCursor) return;
+    try {
+        const response = await fetch(`/api/messages?limit=${ITEMS_PER_PAGE * 5}&cursor=${encodeURIComponent(nextCursor)}`);
+        const data = await response.json();
+        const loadedIds = new Set(allMessages.map(m => m.id));
+        allMessages = allMessages.concat((data.messages || []).filter(m => !loadedIds.has(m.id)));
+        nextCursor = data.next_cursor;
+        // 重新套用当前的搜索条件
+        searchMessages(false);
+    } catch (error) {
+        console.error('Error loading more messages:', error);
+    }
+}
+
 // 更新统计信息
 function updateStats() {
-    document.getElementById('totalCount').textContent = allMessages.length;
+    document.getElementById('totalCount').textContent = Math.max(totalMessages, allMessages.length);
     document.getElementById('resultCount').textContent = filteredMessages.length;
 }
 
@@ -114,7 +151,7 @@ function renderMessages() {
                     <!-- 第一张图片缩略图 -->
                     ${msg.image_paths && msg.image_paths.length > 0 ? `
                         <div style="flex-shrink: 0; width: 60px; height: 60px; border-radius: 4px; overflow: hidden; background: #f5f5f5;">
-                            <img src="${msg.image_paths[0]}" alt="留言配图" style="width: 100%; height: 100%; object-fit: cover;">
+                            <img src="${(msg.image_thumbnails || msg.image_paths)[0]}" alt="留言配图" loading="lazy" style="width: 100%; height: 100%; object-fit: cover;">
                         </div>
                     ` : ''}
                 </div>
@@ -136,8 +173,13 @@ function renderPagination() {
     const container = document.getElementById('paginationContainer');
     const totalPages = getTotalPages();
     
+    // 已加载的留言翻到最后一页时，提供加载更早留言的入口
+    const moreHtml = nextCursor && currentPage >= totalPages
+        ? `<button class="pagination-btn" onclick="loadMoreMessages()">加载更早的留言</button>`
+        : '';
+    
     if (totalPages <= 1) {
-        container.innerHTML = '';
+        container.innerHTML = moreHtml ? `<div class="pagination">${moreHtml}</div>` : '';
         return;
     }
     
@@ -164,6 +206,7 @@ function renderPagination() {
         html += `<button class="pagination-btn" onclick="goToPage(${currentPage + 1})">下一页 →</button>`;
     }
     
+    html += moreHtml;
     html += `<span class="pagination-info">第 ${currentPage} / ${totalPages} 页</span>`;
     html += '</div>';
     
@@ -181,8 +224,8 @@ function goToPage(page) {
     }
 }
 
-// 搜索功能
-function searchMessages() {
+// 搜索功能(在已加载的留言中筛选)
+function searchMessages(resetPage = true) {
     const searchText = document.getElementById('searchInput').value.toLowerCase().trim();
     
     if (!searchText) {
@@ -197,7 +240,9 @@ function searchMessages() {
         });
     }
     
-    currentPage = 1;
+    if (resetPage) {
+        currentPage = 1;
+    }
     updateStats();
     renderMessages();
 }
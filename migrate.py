@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+执行数据库迁移(为已有的 messages.db 补建索引等)
+网站启动时默认会自动执行；数据量很大、希望在低峰期手动执行时，
+设置环境变量 AUTO_MIGRATE=0 启动网站，再运行此脚本。
+注意：添加字段的必需迁移执行完之前，网站的接口会返回 503(只建索引的迁移不影响使用)
+
+用法: python migrate.py          执行所有未执行的迁移
+      python migrate.py --status 只查看迁移状态
+"""
+
+import os
+import sys
+
+# 由本脚本负责执行迁移，导入 app 时不要自动执行
+os.environ['AUTO_MIGRATE'] = '0'
+
+from app import app, MIGRATIONS, OPTIONAL_MIGRATIONS, applied_migrations, run_migrations
+
+
+def show_status():
+    done = applied_migrations()
+    for version, name, steps in MIGRATIONS:
+        mark = '✅ 已执行' if version in done else '⏳ 未执行'
+        kind = '可选' if version in OPTIONAL_MIGRATIONS else '必需'
+        print(f"  {version:>3}  {mark}  [{kind}] {name} ({len(steps)} 步)")
+    return done
+
+
+if __name__ == '__main__':
+    print("=" * 50)
+    print("五月咖啡 - 数据库迁移")
+    print("=" * 50)
+    with app.app_context():
+        done = show_status()
+        if '--status' in sys.argv:
+            sys.exit(0)
+        if all(version in done for version, _, _ in MIGRATIONS):
+            print("\n✨ 数据库已是最新，无需迁移")
+            sys.exit(0)
+        print()
+        run_migrations()
+    print("\n✨ 完成!")
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+批量生成营销活动邀请码(印在传单上)，写入数据库并导出 CSV
+指定 --inviter 时邀请码记在该会员(如门店账号)名下，不指定时不属于任何会员；
+用活动邀请码注册的新会员照常获得奖励积分，邀请人不获得邀请积分。也可以在管理后台调用 POST /api/admin/invitations/bulk
+
+用法: python mint_invitations.py 数量 --campaign 活动名称 [--inviter 会员ID] [--output 文件名.csv]
+例如: python mint_invitations.py 50000 --campaign 2024春季传单
+"""
+
+import argparse
+import time
+
+from app import app, db, Member, INVITATION_MINT_MAX, mint_invitation_codes, invitation_codes_csv
+
+
+def main():
+    parser = argparse.ArgumentParser(description='批量生成营销活动邀请码')
+    parser.add_argument('count', type=int, help=f'生成数量(1-{INVITATION_MINT_MAX})')
+    parser.add_argument('--inviter', type=int, help='邀请人会员ID(可选)')
+    parser.add_argument('--campaign', required=True, help='营销活动名称')
+    parser.add_argument('--output', help='导出的 CSV 文件名，默认 邀请码_活动名称.csv')
+    args = parser.parse_args()
+
+    if not 1 <= args.count <= INVITATION_MINT_MAX:
+        parser.error(f'生成数量需在 1-{INVITATION_MINT_MAX} 之间')
+    campaign = args.campaign.strip()[:50]
+    output = args.output or f'邀请码_{campaign}.csv'
+
+    print("=" * 50)
+    print("五月咖啡 - 批量生成邀请码")
+    print("=" * 50)
+    with app.app_context():
+        if args.inviter is not None and not Member.query.get(args.inviter):
+            parser.error(f'会员 {args.inviter} 不存在')
+        started = time.time()
+        codes = mint_invitation_codes(args.inviter, args.count, campaign)
+        db.session.commit()
+        elapsed = time.time() - started
+
+    with open(output, 'w', encoding='utf-8', newline='') as f:
+        for chunk in invitation_codes_csv(codes, campaign):
+            f.write(chunk)
+    print(f"✅ 生成 {len(codes)} 个邀请码({campaign})，耗时 {elapsed:.2f}s")
+    print(f"📄 已导出到 {output}")
+
+
+if __name__ == '__main__':
+    main()
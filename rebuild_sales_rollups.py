@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+根据已有订单重新生成销售汇总(sales_rollup 表)
+新订单和取消订单会自动更新汇总；第一次上线报表功能、或怀疑汇总有误时运行一次。
+订单按 id 分批读取，内存里只保留汇总结果，订单再多也不会占用太多内存
+
+用法: python rebuild_sales_rollups.py
+重建期间新订单要等重建完成才能提交，建议在营业时间之外运行
+"""
+
+import time
+
+from app import app, rebuild_sales_rollups
+
+
+if __name__ == '__main__':
+    print("=" * 50)
+    print("五月咖啡 - 重建销售汇总")
+    print("=" * 50)
+    started = time.time()
+    with app.app_context():
+        orders, rows = rebuild_sales_rollups()
+    print(f"✅ 统计订单 {orders} 个，生成汇总 {rows} 行，耗时 {time.time() - started:.2f}s")
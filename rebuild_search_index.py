@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+重建留言搜索的全文索引(search_fts，仅 SQLite)
+索引在第一次启动新版本时由数据库迁移自动建立，之后随网站里留言和回复的增删改自动同步；
+用 sqlite3 命令行等方式直接改过 message / reply 表、或怀疑索引不完整时运行一次
+
+用法: python rebuild_search_index.py
+"""
+
+import time
+
+from app import app, db, build_search_index, Message, Reply
+
+
+if __name__ == '__main__':
+    print("=" * 50)
+    print("五月咖啡 - 重建留言搜索索引")
+    print("=" * 50)
+    started = time.time()
+    with app.app_context():
+        with db.engine.begin() as conn:
+            built = build_search_index(conn)
+        if built:
+            print(f"✅ 已为 {Message.query.count()} 条留言、{Reply.query.count()} 条回复建立索引，"
+                  f"耗时 {time.time() - started:.2f}s")
+        else:
+            print("⚠️  当前数据库不支持 FTS5 索引，搜索将使用 LIKE 查找")
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+核对会员积分余额与积分记录是否一致
+每条积分记录都保存了变化后的余额(balance_after)，只需比较每个会员最后一条记录的余额和 member.points，
+不用把全部积分记录加一遍。加 --since 只核对上次核对之后有新积分记录的会员
+
+用法: python reconcile_points.py             核对所有会员
+      python reconcile_points.py --since 1234 只核对积分记录 id 大于 1234 的会员
+"""
+
+import argparse
+
+from app import app, reconcile_points
+
+
+def main():
+    parser = argparse.ArgumentParser(description='核对会员积分')
+    parser.add_argument('--since', type=int, default=0, help='上次核对到的积分记录 id')
+    args = parser.parse_args()
+
+    print("=" * 50)
+    print("五月咖啡 - 核对会员积分")
+    print("=" * 50)
+    with app.app_context():
+        mismatches, last_id = reconcile_points(args.since)
+
+    for row in mismatches:
+        print(f"  ⚠️  {row['username']}(ID {row['member_id']}): 会员积分 {row['points']}，"
+              f"积分记录余额 {row['ledger_balance']}")
+    if mismatches:
+        print(f"\n❌ {len(mismatches)} 个会员的积分与积分记录不一致")
+    else:
+        print("✅ 积分与积分记录一致")
+    print(f"下次核对: python reconcile_points.py --since {last_id}")
+
+
+if __name__ == '__main__':
+    main()